@@ -0,0 +1,777 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from lxml import etree
+from abc import ABC, abstractmethod
+import atexit
+import bisect
+import copy
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import logging
+import tweepy
+import re
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # fall back to the slower stdlib encoder
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # only needed for a compressed (.zst) history file
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Scraping patterns, compiled once rather than on every page
+_FOLLOWER_TEXT_RE = re.compile(r'([\d,KM.]+)\s*[Ff]ollowers?')
+_COMMA_NUM_RE = re.compile(r'\d{1,3}(?:,\d{3})*')
+_BOLD_STYLE_RE = re.compile(r'font-weight:\s*bold')
+_RSS_FOLLOWERS_RE = re.compile(r'"followers(?:_count)?"\s*:\s*"?([\d,.KMB]+)', re.IGNORECASE)
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# Nitter's followers stat as rendered, matched on the raw bytes before any parsing
+_NITTER_FOLLOWERS_RE = re.compile(
+    rb'>\s*Followers\s*</span>\s*<span class="profile-stat-num">\s*([\d,.KMB]+)\s*</span>',
+    re.IGNORECASE
+)
+
+# Suffix multipliers for abbreviated counts like "1.2M"
+_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+# Headers for web scraping
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # urllib3 adds br only when a brotli package is installed to decode it
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+def _build_session(retries):
+    """Create a shared scraping session with pooled, kept-alive connections"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # One pool per host (8 Nitter instances, or Social Blade, with headroom),
+    # each big enough for the concurrent requests to that host
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=8,
+        max_retries=Retry(total=retries, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    atexit.register(session.close)
+    return session
+
+# Sessions are per process, shared by every bot instance. Nitter mirrors are
+# raced against each other, so a failing one is dropped rather than retried
+_SESSION = _build_session(retries=2)
+_NITTER_SESSION = _build_session(retries=0)
+
+def _json_dumps(data, pretty=False):
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode()
+
+def _json_loads(content):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _html_pull_parser(response, **options):
+    """HTML pull parser for a response, decoding with the charset it declares"""
+    # Not response.encoding: requests falls back to ISO-8859-1 for text/html
+    # without a charset, which would mis-decode UTF-8 pages
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    if match:
+        # libxml2 has its own encoding names, so only lxml can say if it knows this one
+        try:
+            return etree.HTMLPullParser(encoding=match.group(1), **options)
+        except LookupError:
+            pass
+    # Let the parser detect the encoding from the page itself
+    return etree.HTMLPullParser(**options)
+
+@functools.lru_cache(maxsize=1024)
+def parse_count(count_text):
+    """Parse follower count text (handles K, M, B notation)"""
+    if not count_text:
+        return None
+        
+    count_text = count_text.strip().replace(',', '').replace(' ', '')
+    if not count_text:
+        return None
+    
+    multiplier = _MULTIPLIERS.get(count_text[-1].upper())
+    try:
+        if multiplier:
+            return round(float(count_text[:-1]) * multiplier)
+        return int(count_text)
+    except ValueError:
+        return None
+
+class FollowerCore(ABC):
+    """Scraping, history and tweeting shared by the follower bot entrypoints"""
+    
+    # Whether to tweet when no follower count could be obtained
+    post_error_tweet = False
+    
+    def __init__(self):
+        # Configuration
+        self.target_username = os.getenv('TARGET_USERNAME', 'elonmusk')
+        self.data_file = os.getenv('DATA_FILE', 'follower_data.json')
+        self.cache_ttl = 10 * 60  # seconds
+        self.me_cache_file = '.twitter_me_cache.json'
+        # Outlasts the daily schedule; a 401/403 on posting clears it anyway
+        self.me_cache_ttl = 7 * 24 * 3600  # seconds
+        self.mirror_cache_file = 'nitter_cache.json'
+        # How long to trust a Nitter probe result, by outcome (seconds). The
+        # workflow runs daily: live instances are re-probed every run, a failing
+        # one sits out the next run and an unreachable one the next two
+        self.mirror_cache_ttls = {
+            'ok': 60 * 60,
+            'timeout': 3 * 24 * 3600,
+            'error': 3 * 24 * 3600,
+            'status': 36 * 3600,  # any non-200 response
+        }
+        # How long before a feed found without the count is tried again (seconds).
+        # Stock Nitter feeds never carry it, so this spans many daily runs
+        self.rss_cache_ttl = 14 * 24 * 3600
+        
+        # Twitter API credentials
+        self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
+        self.api_key = os.getenv('TWITTER_API_KEY')
+        self.api_secret = os.getenv('TWITTER_API_SECRET')
+        self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
+        self.access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
+        
+        if self.compress_data and zstandard is None:
+            raise RuntimeError(f"zstandard is required to use {self.data_file} (pip install zstandard)")
+        
+        # Scraping sessions (and the headers they send) are shared module-wide
+        self.session = _SESSION
+        self.nitter_session = _NITTER_SESSION
+        
+        # Successful scrapes keyed by (username, cache_ttl window)
+        self.count_cache = {}
+        
+        # Last probe result, success time and RSS support per Nitter instance
+        self.mirror_status = {}
+    
+    @property
+    def compress_data(self):
+        """Whether the history file is stored zstd-compressed"""
+        return self.data_file.endswith('.zst')
+    
+    @functools.cached_property
+    def client(self):
+        """Twitter API client, only set up once something needs to tweet"""
+        return self.setup_twitter_api()
+    
+    def setup_twitter_api(self):
+        """Initialize Twitter API client"""
+        client = None
+        try:
+            if not all([self.bearer_token, self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
+                logger.error("Missing Twitter API credentials")
+                return None
+            
+            client = tweepy.Client(
+                bearer_token=self.bearer_token,
+                consumer_key=self.api_key,
+                consumer_secret=self.api_secret,
+                access_token=self.access_token,
+                access_token_secret=self.access_token_secret,
+                wait_on_rate_limit=True
+            )
+            
+            # Skip the auth check if it already passed recently
+            cache = self.load_cache(self.me_cache_file, self.me_cache_ttl)
+            if cache:
+                logger.info(f"✓ Twitter API authenticated as: @{cache['username']} (cached)")
+                return client
+            
+            # Test authentication
+            me = client.get_me()
+            if me.data:
+                logger.info(f"✓ Twitter API authenticated as: @{me.data.username}")
+                self.save_cache(self.me_cache_file, username=me.data.username)
+            else:
+                logger.error("✗ Twitter API authentication failed")
+            
+        except Exception as e:
+            logger.error(f"✗ Twitter API setup failed: {e}")
+        
+        return client
+    
+    def load_cache(self, path, ttl):
+        """Return the contents of a JSON cache file if it was written within ttl seconds"""
+        try:
+            with open(path, 'rb') as f:
+                cache = _json_loads(f.read())
+            if time.time() - cache['checked_at'] < ttl:
+                return cache
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def save_cache(self, path, **values):
+        """Write values to a JSON cache file, stamped with the current time"""
+        try:
+            with open(path, 'wb') as f:
+                f.write(_json_dumps({**values, 'checked_at': time.time()}))
+        except OSError as e:
+            logger.warning(f"Could not write {path}: {e}")
+    
+    def clear_me_cache(self):
+        """Forget the cached auth check so the next setup re-validates"""
+        try:
+            os.remove(self.me_cache_file)
+        except FileNotFoundError:
+            pass
+    
+    def get_follower_count(self, username, previous_count=None):
+        """Get follower count, reusing a scrape from the current cache window"""
+        key = (username, int(time.time() // self.cache_ttl))
+        if key in self.count_cache:
+            logger.info(f"✓ Reusing follower count for @{username} scraped earlier in this process")
+            return self.count_cache[key]
+        
+        count = self.scrape_follower_count(username, previous_count)
+        if count:
+            # Only the current window can be hit again, so drop older entries
+            self.count_cache = {k: v for k, v in self.count_cache.items() if k[1] == key[1]}
+            self.count_cache[key] = count
+        return count
+    
+    def scrape_follower_count(self, username, previous_count=None):
+        """Scrape follower count from multiple sources"""
+        logger.info(f"Getting follower count for @{username}")
+        
+        # Method 1: Try Nitter instances
+        nitter_instances = [
+            "https://nitter.net",
+            "https://nitter.it",
+            "https://nitter.privacydev.net",
+            "https://nitter.fdn.fr", 
+            "https://nitter.kavin.rocks",
+            "https://nitter.1d4.us",
+            "https://nitter.42l.fr",
+            "https://nitter.pussthecat.org"
+        ]
+        
+        # Only fetch and parse full pages from instances that answer a quick probe
+        alive_instances = self.get_alive_instances(nitter_instances, username)
+        
+        # Fetch from live instances concurrently and take the first count close to
+        # the last known one, instead of waiting out each slow mirror in turn. A
+        # count that moved further is held back in case another mirror agrees
+        # with the history, but still beats Social Blade. The other fetches are
+        # told to stop at their next step; one already waiting on a response
+        # still runs until its timeout, so the process may outlive the return
+        if alive_instances:
+            stop = threading.Event()
+            fallback_count = None
+            executor = ThreadPoolExecutor(max_workers=len(alive_instances))
+            try:
+                futures = {
+                    executor.submit(
+                        self.try_nitter_instance, instance, username, previous_count, stop,
+                        self.rss_worth_trying(instance)
+                    ): instance
+                    for instance in alive_instances
+                }
+                for future in as_completed(futures):
+                    # Workers report what they learned rather than writing to
+                    # mirror_status themselves; later ones are not recorded
+                    instance = futures[future]
+                    count, rss = future.result()
+                    if rss is not None:
+                        self.mirror_status[instance].update(rss=rss, rss_checked_at=time.time())
+                    if count:
+                        # Try this instance first next time
+                        self.mirror_status[instance]['last_ok'] = time.time()
+                        if not previous_count or self.is_expected_count(count, previous_count):
+                            return count
+                        fallback_count = fallback_count or count
+                
+                if fallback_count:
+                    logger.info(f"✓ Accepting {fallback_count:,}, more than 5% from the last count of {previous_count:,}")
+                    return fallback_count
+            finally:
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.save_mirror_status(self.mirror_status)
+        
+        # Method 2: Try Social Blade
+        count = self.try_social_blade(username)
+        if count:
+            return count
+        
+        logger.error("❌ All scraping methods failed")
+        return None
+    
+    def get_alive_instances(self, instances, username):
+        """Return the Nitter instances worth fetching, most recently successful first"""
+        now = time.time()
+        self.mirror_status = mirror_status = self.load_mirror_status()
+        
+        # Only re-probe instances whose last result has expired
+        stale = [
+            instance for instance in instances
+            if instance not in mirror_status
+            or now - mirror_status[instance]['checked_at'] >= mirror_status[instance]['ttl']
+        ]
+        if stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                results = list(executor.map(lambda instance: self.probe_instance(instance, username), stale))
+            for instance, (result, latency) in zip(stale, results):
+                ttl = self.mirror_cache_ttls.get(result, self.mirror_cache_ttls['status'])
+                mirror_status.setdefault(instance, {}).update(status=result, checked_at=now, ttl=ttl, latency=latency)
+            self.save_mirror_status(mirror_status)
+        
+        # Most recently successful first, then fastest to answer the probe
+        alive = [instance for instance in instances if mirror_status[instance]['status'] == 'ok']
+        alive.sort(key=lambda instance: (
+            -mirror_status[instance].get('last_ok', 0),
+            mirror_status[instance].get('latency') or float('inf')
+        ))
+        logger.info(f"Nitter probe: {len(alive)}/{len(instances)} instances up ({len(instances) - len(stale)} cached)")
+        return alive
+    
+    def probe_instance(self, instance, username):
+        """Cheap HEAD request to check a Nitter instance is serving profiles
+        
+        Returns the probe outcome and how long the instance took to answer.
+        """
+        start = time.monotonic()
+        try:
+            response = self.nitter_session.head(f"{instance}/{username}", timeout=3, allow_redirects=True)
+        except requests.exceptions.Timeout:
+            return 'timeout', None
+        except requests.exceptions.RequestException:
+            return 'error', None
+        latency = round(time.monotonic() - start, 3)
+        
+        # 405 means the instance just doesn't support HEAD, so give it the full GET
+        if response.status_code in (200, 405):
+            return 'ok', latency
+        return str(response.status_code), latency
+    
+    def load_mirror_status(self):
+        """Load the last probe result for each Nitter instance"""
+        try:
+            with open(self.mirror_cache_file, 'rb') as f:
+                mirror_status = _json_loads(f.read())
+            return {instance: entry for instance, entry in mirror_status.items() if isinstance(entry, dict)}
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def save_mirror_status(self, mirror_status):
+        """Save the probe result for each Nitter instance"""
+        # Serialize a snapshot, so nothing changing underneath can break the encoder
+        content = _json_dumps(copy.deepcopy(mirror_status), pretty=True)
+        try:
+            with open(self.mirror_cache_file, 'wb') as f:
+                f.write(content)
+        except OSError as e:
+            logger.warning(f"Could not write {self.mirror_cache_file}: {e}")
+    
+    def is_plausible_count(self, count, previous_count=None):
+        """Sanity check a scraped count, also allowing small counts close to the last known one"""
+        if not count:
+            return False
+        if previous_count and self.is_expected_count(count, previous_count):
+            return True
+        return count > 1000
+    
+    def is_expected_count(self, count, previous_count):
+        """Whether a count is within 5% of the last known count"""
+        return abs(count - previous_count) / previous_count < 0.05
+    
+    def try_nitter_rss(self, instance, username):
+        """Try to read the follower count from a Nitter instance's RSS feed"""
+        try:
+            response = self.nitter_session.get(f"{instance}/{username}/rss", timeout=15)
+        except requests.exceptions.RequestException as e:
+            logger.info(f"✗ {instance} RSS failed: {str(e)[:100]}")
+            return None
+        if response.status_code != 200:
+            return None
+        
+        try:
+            channel = etree.fromstring(
+                response.content,
+                etree.XMLParser(resolve_entities=False, no_network=True)
+            ).find('channel')
+        except etree.XMLSyntaxError:
+            return None
+        if channel is None:
+            return None
+        
+        # Forks that expose the count put it in the channel title/description,
+        # either as "followers": N or as "N Followers"
+        text = ' '.join(channel.findtext(tag) or '' for tag in ('title', 'description'))
+        match = _RSS_FOLLOWERS_RE.search(text) or _FOLLOWER_TEXT_RE.search(text)
+        return self.parse_count(match.group(1)) if match else None
+    
+    def rss_worth_trying(self, instance):
+        """Whether to try an instance's RSS feed before its profile page"""
+        # The feed is a fraction of the page, so keep using it where it has
+        # carried the count, and try it on instances not recently found to
+        # leave the count out (or to fail to serve it)
+        mirror = self.mirror_status.get(instance, {})
+        if mirror.get('rss', True):
+            return True
+        return time.time() - mirror.get('rss_checked_at', 0) >= self.rss_cache_ttl
+    
+    def try_nitter_instance(self, instance, username, previous_count=None, stop=None, use_rss=True):
+        """Try to get follower count from a Nitter instance
+        
+        Returns the count (or None) and whether the RSS feed carried it, or None
+        if the feed wasn't tried. Gives up between requests and between page
+        chunks once stop is set.
+        """
+        logger.info(f"Trying {instance}")
+        
+        rss = None
+        if use_rss and not (stop is not None and stop.is_set()):
+            count = self.try_nitter_rss(instance, username)
+            rss = count is not None
+            if self.is_plausible_count(count, previous_count):
+                logger.info(f"✓ Found follower count from {instance} RSS: {count:,}")
+                return count, rss
+        
+        # A failed feed falls through to the profile page
+        return self.try_nitter_page(instance, username, previous_count, stop), rss
+    
+    def try_nitter_page(self, instance, username, previous_count=None, stop=None):
+        """Try to get follower count from a Nitter instance's profile page"""
+        try:
+            url = f"{instance}/{username}"
+            if stop is not None and stop.is_set():
+                return None
+            with self.nitter_session.get(url, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    logger.info(f"✗ {instance} returned status {response.status_code}")
+                    return None
+                
+                # Parse the page as it downloads so we can stop reading once the stats are in
+                parser = _html_pull_parser(response, events=('end',), tag='span')
+                count_text = None
+                tail = b''
+                for chunk in response.iter_content(4096):
+                    # Another instance already answered; closing the response drops the connection
+                    if stop is not None and stop.is_set():
+                        return None
+                    
+                    # Stock Nitter markup is matched straight off the bytes, keeping
+                    # the previous chunk's tail in case the stat straddles two chunks
+                    window = tail + chunk
+                    match = _NITTER_FOLLOWERS_RE.search(window)
+                    if match:
+                        count_text = match.group(1).decode('ascii')
+                        break
+                    tail = window[-256:]
+                    
+                    parser.feed(chunk)
+                    
+                    # Otherwise look for the profile-stat-num span inside the stat block labelled followers
+                    for _, span in parser.read_events():
+                        if 'profile-stat-num' not in (span.get('class') or '').split():
+                            continue
+                        stat = span.getparent()
+                        if stat is None:
+                            continue
+                        # Nitter marks the block with a "followers" class; only read its text if not
+                        if 'followers' not in (stat.get('class') or '').split() and \
+                                'follower' not in ''.join(stat.itertext()).lower():
+                            continue
+                        
+                        count_text = ''.join(span.itertext()).strip()
+                        break
+                    if count_text is not None:
+                        break
+                else:
+                    parser.close()
+            
+            if count_text is None:
+                logger.info(f"✗ No follower count found on {instance}")
+                return None
+            
+            # This is the followers stat, so the rest of the page isn't needed either way
+            count = self.parse_count(count_text)
+            if self.is_plausible_count(count, previous_count):
+                logger.info(f"✓ Found follower count from {instance}: {count:,}")
+                return count
+            logger.info(f"✗ Implausible follower count on {instance}: {count}")
+            return None
+            
+        except requests.exceptions.Timeout:
+            logger.warning(f"✗ {instance} timed out")
+            return None
+        except requests.exceptions.ConnectionError:
+            logger.warning(f"✗ {instance} connection failed")
+            return None
+        except Exception as e:
+            logger.warning(f"✗ {instance} failed: {str(e)[:100]}")
+            return None
+    
+    def try_social_blade(self, username):
+        """Try to get follower count from Social Blade"""
+        try:
+            url = f"https://socialblade.com/twitter/user/{username}"
+            logger.info("Trying Social Blade")
+            
+            with self.session.get(url, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    logger.info(f"✗ Social Blade returned status {response.status_code}")
+                    return None
+                
+                # Track the largest number that could be a follower count
+                follower_count = 0
+                
+                # Check stat elements as they are parsed instead of buffering the whole page first
+                parser = _html_pull_parser(response, events=('end',))
+                for chunk in response.iter_content(4096):
+                    parser.feed(chunk)
+                    for _, element in parser.read_events():
+                        # Social Blade uses bold (or bold-styled spans) for stats
+                        if element.tag in ('b', 'strong') or (
+                            element.tag == 'span' and _BOLD_STYLE_RE.search(element.get('style') or '')
+                        ):
+                            text = ''.join(element.itertext()).strip()
+                            if _COMMA_NUM_RE.fullmatch(text):
+                                num = int(text.replace(',', ''))
+                                if 1000 <= num <= 500000000 and num > follower_count:  # Reasonable range
+                                    follower_count = num
+                        
+                        # Drop finished siblings so only the branch being parsed stays in memory
+                        # (kept inside stat elements, whose text is still needed)
+                        parent = element.getparent()
+                        if parent is not None and parent.tag not in ('b', 'strong', 'span'):
+                            while element.getprevious() is not None:
+                                del parent[0]
+                parser.close()
+            
+            if follower_count:
+                # The largest number is most likely to be followers
+                logger.info(f"✓ Found follower count from Social Blade: {follower_count:,}")
+                return follower_count
+            
+            logger.info("✗ No follower count found on Social Blade")
+            return None
+            
+        except Exception as e:
+            logger.warning(f"✗ Social Blade failed: {e}")
+            return None
+    
+    parse_count = staticmethod(parse_count)
+    
+    def load_data(self):
+        """Load historical follower data"""
+        try:
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'rb') as f:
+                    content = f.read()
+                if self.compress_data:
+                    content = zstandard.ZstdDecompressor().decompress(content)
+                data = _json_loads(content)
+                
+                # Migrate records written with ISO 'timestamp' strings to epoch 'ts'
+                for history in data.values():
+                    for record in history:
+                        if 'ts' not in record:
+                            record['ts'] = int(datetime.fromisoformat(record.pop('timestamp')).timestamp())
+                
+                logger.info(f"Loaded historical data with {len(data)} accounts")
+                return data
+            else:
+                logger.info("No historical data found, starting fresh")
+                return {}
+        except Exception as e:
+            logger.error(f"Error loading data: {e}")
+            return {}
+    
+    def get_cached_count(self, history):
+        """Return the latest recorded count if it is fresh enough to skip scraping"""
+        if not history:
+            return None
+        
+        latest = history[-1]
+        age = time.time() - latest['ts']
+        if age < self.cache_ttl:
+            logger.info(f"✓ Cache hit: reusing follower count from {age / 60:.0f} min ago")
+            return latest['followers_count']
+        
+        return None
+    
+    def save_data(self, data):
+        """Save follower data to file, skipping the write if nothing changed"""
+        try:
+            content = _json_dumps(data, pretty=True)
+            if self.compress_data:
+                content = zstandard.ZstdCompressor(level=3).compress(content)
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'rb') as f:
+                    if f.read() == content:
+                        logger.info("Data unchanged, skipping save")
+                        return
+            
+            # Write a temp file and swap it in so a failed write never truncates the history
+            tmp_file = f"{self.data_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_file, self.data_file)
+            logger.info("Data saved successfully")
+        except Exception as e:
+            logger.error(f"Error saving data: {e}")
+    
+    def calculate_change(self, current_count, history):
+        """Calculate follower change from ~24 hours ago"""
+        if not history:
+            return None, None, None
+        
+        now = time.time()
+        target_time = now - 24 * 3600
+        
+        # Find the closest record to 24 hours ago; history is appended in time
+        # order, so only the records either side of the target need comparing
+        timestamps = [record['ts'] for record in history]
+        index = bisect.bisect_left(timestamps, target_time)
+        neighbours = [history[i] for i in (index - 1, index) if 0 <= i < len(history)]
+        closest_record = min(neighbours, key=lambda record: abs(record['ts'] - target_time))
+        
+        change = current_count - closest_record['followers_count']
+        hours_ago = (now - closest_record['ts']) / 3600
+        return change, hours_ago, closest_record['followers_count']
+    
+    @abstractmethod
+    def format_tweet(self, username, current_count, change, hours_ago, previous_count):
+        """Format tweet message (within 280 characters)"""
+    
+    def format_error_tweet(self, username):
+        """Format the tweet sent when the follower count could not be obtained"""
+        return f"❌ Could not get follower count for @{username} today. Will try again tomorrow! #FollowerTracker"
+    
+    def post_tweet(self, message):
+        """Post tweet to Twitter"""
+        if not self.client:
+            logger.error("Twitter API client not available")
+            return False
+        
+        try:
+            response = self.client.create_tweet(text=message)
+            if response.data:
+                tweet_id = response.data['id']
+                tweet_url = f"https://twitter.com/i/status/{tweet_id}"
+                logger.info(f"✓ Tweet posted successfully: {tweet_url}")
+                return True
+            else:
+                logger.error("✗ Tweet response has no data")
+                return False
+            
+        except tweepy.Forbidden as e:
+            # A rerun on a reused count posts the same text again; that tweet is already up
+            if 187 in e.api_codes or any('duplicate' in message.lower() for message in e.api_messages):
+                logger.info("✓ Tweet already posted (duplicate content)")
+                return True
+            logger.error(f"✗ Error posting tweet: {e}")
+            # The cached auth check may be stale; drop it so the client is re-validated
+            self.clear_me_cache()
+            self.__dict__.pop('client', None)
+            return False
+        except tweepy.Unauthorized as e:
+            logger.error(f"✗ Error posting tweet: {e}")
+            # The cached auth check may be stale; drop it so the client is re-validated
+            self.clear_me_cache()
+            self.__dict__.pop('client', None)
+            return False
+        except Exception as e:
+            logger.error(f"✗ Error posting tweet: {e}")
+            return False
+    
+    def run(self):
+        """Main execution function"""
+        logger.info("=" * 60)
+        logger.info(f"Starting follower tracking for @{self.target_username}")
+        logger.info("=" * 60)
+        
+        # Load historical data
+        all_data = self.load_data()
+        user_history = all_data.get(self.target_username, [])
+        
+        # Get current follower count, reusing a recent scrape if there is one
+        current_count = self.get_cached_count(user_history)
+        cached = current_count is not None
+        if not cached:
+            previous_count = user_history[-1]['followers_count'] if user_history else None
+            current_count = self.get_follower_count(self.target_username, previous_count)
+        if not current_count:
+            # Post error tweet
+            if self.post_error_tweet and self.client:
+                self.post_tweet(self.format_error_tweet(self.target_username))
+            return False
+        
+        logger.info(f"✓ Current followers: {current_count:,}")
+        
+        if cached:
+            # The cached count is already the latest record; compare against what came before it
+            change, hours_ago, previous_count = self.calculate_change(current_count, user_history[:-1])
+        else:
+            # Calculate change from 24 hours ago
+            change, hours_ago, previous_count = self.calculate_change(current_count, user_history)
+            
+            # Add new record
+            new_record = {
+                'followers_count': current_count,
+                'ts': int(time.time())
+            }
+            user_history.append(new_record)
+        
+        # Keep only last 30 days to save space; history is in time order, so
+        # everything from the first record after the cutoff onwards is kept
+        cutoff = time.time() - 30 * 24 * 3600
+        timestamps = [record['ts'] for record in user_history]
+        user_history = user_history[bisect.bisect_right(timestamps, cutoff):]
+        
+        # Save updated data
+        all_data[self.target_username] = user_history
+        self.save_data(all_data)
+        
+        # Format tweet message
+        tweet_text = self.format_tweet(
+            self.target_username, 
+            current_count, 
+            change, 
+            hours_ago, 
+            previous_count
+        )
+        
+        # Display tweet preview
+        logger.info("Tweet to post:")
+        logger.info("=" * 50)
+        logger.info(tweet_text)
+        logger.info(f"Characters: {len(tweet_text)}/280")
+        logger.info("=" * 50)
+        
+        # Post tweet
+        success = self.post_tweet(tweet_text)
+        
+        if success:
+            logger.info("✅ Bot run completed successfully!")
+        else:
+            logger.error("❌ Failed to post tweet")
+        
+        return success
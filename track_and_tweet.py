@@ -1,208 +1,13 @@
 # track_and_tweet.py
-import requests
-from bs4 import BeautifulSoup
-import json
-import os
-from datetime import datetime, timedelta
 import logging
-import tweepy
-import re
+
+from follower_core import FollowerCore
 
 logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
 
-class TwitterFollowerBot:
-    def __init__(self):
-        self.target_username = os.getenv('TARGET_USERNAME', 'elonmusk')
-        self.data_file = 'follower_data.json'
-        
-        # Twitter API credentials
-        self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-        self.api_key = os.getenv('TWITTER_API_KEY')
-        self.api_secret = os.getenv('TWITTER_API_SECRET')
-        self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-        self.access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-        
-        # Initialize Twitter API
-        self.setup_twitter_api()
-        
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-    
-    def setup_twitter_api(self):
-        """Initialize Twitter API client"""
-        try:
-            self.client = tweepy.Client(
-                bearer_token=self.bearer_token,
-                consumer_key=self.api_key,
-                consumer_secret=self.api_secret,
-                access_token=self.access_token,
-                access_token_secret=self.access_token_secret,
-                wait_on_rate_limit=True
-            )
-            
-            # Test authentication
-            me = self.client.get_me()
-            logger.info(f"Twitter API authenticated as: @{me.data.username}")
-            
-        except Exception as e:
-            logger.error(f"Twitter API setup failed: {e}")
-            self.client = None
-    
-    def get_follower_count(self, username):
-        """Scrape follower count from multiple sources"""
-        
-        # Method 1: Try multiple Nitter instances with better error handling
-        nitter_instances = [
-            "https://nitter.net",
-            "https://nitter.it",
-            "https://nitter.fdn.fr",
-            "https://nitter.kavin.rocks",
-            "https://nitter.unixfox.eu",
-            "https://nitter.domain.glass"
-        ]
-        
-        for instance in nitter_instances:
-            try:
-                url = f"{instance}/{username}"
-                logger.info(f"Trying {instance}")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Multiple methods to find follower count
-                    count = None
-                    
-                    # Method 1: profile-stat-num class
-                    stats = soup.find_all('span', class_='profile-stat-num')
-                    if len(stats) >= 2:  # Should have tweets, following, followers
-                        count_text = stats[1].get_text().strip()  # Followers usually at index 1
-                        count = self.parse_count(count_text)
-                    
-                    # Method 2: Look for profile-stat with "followers" text
-                    if not count:
-                        stat_divs = soup.find_all('div', class_='profile-stat')
-                        for div in stat_divs:
-                            if 'follower' in div.get_text().lower():
-                                num_span = div.find('span', class_='profile-stat-num')
-                                if num_span:
-                                    count = self.parse_count(num_span.get_text().strip())
-                                    break
-                    
-                    # Method 3: Look for any text with "followers"
-                    if not count:
-                        follower_elements = soup.find_all(string=re.compile(r'[\d,KM.]+\s*[Ff]ollowers?'))
-                        for element in follower_elements:
-                            match = re.search(r'([\d,KM.]+)', element)
-                            if match:
-                                count = self.parse_count(match.group(1))
-                                if count:
-                                    break
-                    
-                    if count and count > 100:  # Basic sanity check
-                        logger.info(f"✓ Got follower count from {instance}: {count:,}")
-                        return count
-                    else:
-                        logger.info(f"✗ No valid count found on {instance}")
-                else:
-                    logger.info(f"✗ {instance} returned status {response.status_code}")
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"✗ {instance} timed out")
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"✗ {instance} connection failed")
-            except Exception as e:
-                logger.warning(f"✗ {instance} failed: {str(e)[:100]}")
-                continue
-        
-        # Method 2: Try Social Blade
-        logger.info("Trying Social Blade...")
-        try:
-            url = f"https://socialblade.com/twitter/user/{username}"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for follower count in Social Blade
-                # Try to find elements that might contain follower count
-                potential_numbers = []
-                
-                # Look for numbers in span tags with specific styles
-                number_spans = soup.find_all('span', style=re.compile(r'font-weight:\s*bold'))
-                for span in number_spans:
-                    text = span.get_text().strip()
-                    if re.match(r'^\d{1,3}(,\d{3})*
-    
-    def parse_count(self, count_text):
-        """Parse follower count text (handles K, M notation)"""
-        if not count_text:
-            return None
-            
-        count_text = count_text.strip().upper().replace(',', '').replace(' ', '')
-        
-        try:
-            # Handle decimal notation like "1.2M" or "150.5K"
-            if 'K' in count_text:
-                base = float(count_text.replace('K', ''))
-                return int(base * 1000)
-            elif 'M' in count_text:
-                base = float(count_text.replace('M', ''))
-                return int(base * 1000000)
-            elif 'B' in count_text:
-                base = float(count_text.replace('B', ''))
-                return int(base * 1000000000)
-            else:
-                # Just a regular number
-                return int(count_text)
-        except (ValueError, TypeError):
-            return None
-    
-    def load_data(self):
-        """Load historical data"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            logger.error(f"Error loading data: {e}")
-            return {}
-    
-    def save_data(self, data):
-        """Save data to file"""
-        try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving data: {e}")
-    
-    def calculate_change(self, current_count, history):
-        """Calculate change from ~24 hours ago"""
-        if not history:
-            return None, None, None
-        
-        now = datetime.now()
-        target_time = now - timedelta(hours=24)
-        
-        closest_record = None
-        min_diff = float('inf')
-        
-        for record in history:
-            record_time = datetime.fromisoformat(record['timestamp'])
-            diff = abs((record_time - target_time).total_seconds())
-            if diff < min_diff:
-                min_diff = diff
-                closest_record = record
-        
-        if closest_record:
-            change = current_count - closest_record['followers_count']
-            hours_ago = (now - datetime.fromisoformat(closest_record['timestamp'])).total_seconds() / 3600
-            return change, hours_ago, closest_record['followers_count']
-        
-        return None, None, None
+class TwitterFollowerBot(FollowerCore):
+    # Tell followers when a day's count could not be fetched
+    post_error_tweet = True
     
     def format_tweet(self, username, current_count, change, hours_ago, previous_count):
         """Format tweet message (within 280 chars)"""
@@ -227,89 +32,22 @@ class TwitterFollowerBot:
             change_text = "0"
             verb = "no change"
         
-        # Keep it concise for Twitter's 280 char limit
-        tweet = f"{emoji} @{username} {verb} {change_text} followers in ~{hours_ago:.0f}h\n\n"
-        tweet += f"📊 {current_formatted}\n"
-        tweet += f"📈 {change_text}\n\n"
-        tweet += f"#FollowerTracker"
-        
-        # Truncate if too long
-        if len(tweet) > 280:
+        hours_text = f"{hours_ago:.0f}"
+        
+        # Keep it concise for Twitter's 280 char limit; the full template's fixed
+        # text is at most 47 chars, so pick the template from the variable parts
+        predicted_len = 47 + len(username) + len(verb) + 2 * len(change_text) + len(current_formatted) + len(hours_text)
+        if predicted_len <= 280:
+            tweet = ''.join((
+                f"{emoji} @{username} {verb} {change_text} followers in ~{hours_text}h\n\n",
+                f"📊 {current_formatted}\n",
+                f"📈 {change_text}\n\n",
+                "#FollowerTracker"
+            ))
+        else:
             tweet = f"{emoji} @{username} {verb} {change_text} followers\n\n📊 {current_formatted} | 📈 {change_text}\n\n#FollowerTracker"
         
         return tweet
-    
-    def post_tweet(self, message):
-        """Post tweet to Twitter"""
-        if not self.client:
-            logger.error("Twitter API client not available")
-            return False
-        
-        try:
-            response = self.client.create_tweet(text=message)
-            tweet_id = response.data['id']
-            tweet_url = f"https://twitter.com/i/status/{tweet_id}"
-            logger.info(f"Tweet posted successfully: {tweet_url}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error posting tweet: {e}")
-            return False
-    
-    def run(self):
-        """Main execution function"""
-        logger.info(f"Tracking followers for @{self.target_username}")
-        
-        # Get current follower count
-        current_count = self.get_follower_count(self.target_username)
-        if not current_count:
-            error_tweet = f"❌ Could not get follower count for @{self.target_username} today. Will try again tomorrow! #FollowerTracker"
-            if self.client:
-                self.post_tweet(error_tweet)
-            logger.error("Could not get follower count")
-            return False
-        
-        logger.info(f"Current followers: {current_count:,}")
-        
-        # Load and process data
-        all_data = self.load_data()
-        user_history = all_data.get(self.target_username, [])
-        
-        # Calculate change
-        change, hours_ago, previous_count = self.calculate_change(current_count, user_history)
-        
-        # Add new record
-        user_history.append({
-            'followers_count': current_count,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        # Keep only last 30 days
-        cutoff = datetime.now() - timedelta(days=30)
-        user_history = [r for r in user_history if datetime.fromisoformat(r['timestamp']) > cutoff]
-        
-        # Save data
-        all_data[self.target_username] = user_history
-        self.save_data(all_data)
-        
-        # Format and post tweet
-        tweet_text = self.format_tweet(self.target_username, current_count, change, hours_ago, previous_count)
-        
-        print("Tweet to post:")
-        print("=" * 50)
-        print(tweet_text)
-        print(f"Characters: {len(tweet_text)}/280")
-        print("=" * 50)
-        
-        # Post tweet
-        success = self.post_tweet(tweet_text)
-        
-        if success:
-            logger.info("Successfully posted follower update tweet!")
-        else:
-            logger.error("Failed to post tweet")
-        
-        return success
 
 if __name__ == "__main__":
     bot = TwitterFollowerBot()